@@ -6,6 +6,7 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from enum import StrEnum
 from typing import Final
 
 from flext_target_ldap import t
@@ -29,6 +30,20 @@ class FlextTargetLdapConstantsBase:
     DEFAULT_BIND_PASSWORD: Final[str] = ""
     DEFAULT_OBJECT_CLASS: Final[str] = "top"
 
+    # URI schemes indexed by ``use_ssl`` (False -> ldap, True -> ldaps)
+    URI_SCHEMES: Final[tuple[str, str]] = ("ldap", "ldaps")
+
+    # RFC 4511 attribute selector asking the server to return no attributes
+    NO_ATTRIBUTES: Final[str] = "1.1"
+
+    # Per-client DN existence cache (seconds; missing DNs expire sooner)
+    EXISTS_CACHE_TTL: Final[float] = 300.0
+    MISSING_CACHE_TTL: Final[float] = 30.0
+    EXISTS_CACHE_MAXSIZE: Final[int] = 10_000
+    DN_NORMALIZE_CACHE_SIZE: Final[int] = 4096
+    # Most RDN terms OR-ed into one batched existence filter
+    EXISTS_FILTER_CHUNK: Final[int] = 100
+
     # Reusable scalar tokens
 
     # Configuration keys used across utilities/settings/sinks
@@ -50,3 +65,10 @@ class FlextTargetLdapConstantsBase:
 
     # Allowed operation modes
     DEFAULT_BASE_DN: Final[str] = "dc=example,dc=com"
+
+    class WriteKind(StrEnum):
+        """LDAP write operations accepted by the batched client path."""
+
+        ADD = "add"
+        MODIFY = "modify"
+        DELETE = "delete"
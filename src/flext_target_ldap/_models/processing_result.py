@@ -6,6 +6,8 @@ from __future__ import annotations
 class FlextTargetLdapProcessingCounters:
     """Common counters and mutations for record processing outcomes."""
 
+    __slots__ = ("error_count", "errors", "processed_count", "success_count")
+
     processed_count: int
     success_count: int
     error_count: int
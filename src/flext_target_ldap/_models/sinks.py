@@ -11,6 +11,7 @@ from typing import ClassVar, override
 
 from flext_target_ldap import (
     c,
+    m,
     p,
     r,
     t,
@@ -82,6 +83,8 @@ logger = u.fetch_logger(__name__)
 class FlextTargetLdapProcessingResult(FlextTargetLdapProcessingCounters):
     """Result of LDAP processing operations - mutable for performance tracking."""
 
+    __slots__ = ()
+
     @override
     def __init__(self) -> None:
         """Initialize processing result counters."""
@@ -94,6 +97,9 @@ class FlextTargetLdapProcessingResult(FlextTargetLdapProcessingCounters):
 class FlextTargetLdapBaseSink(FlextTargetLdapSink):
     """Base LDAP sink with common functionality."""
 
+    # Singer field to LDAP attribute pairs written ahead of attribute_mapping
+    _FIELD_MAP: ClassVar[tuple[tuple[str, str], ...]] = ()
+
     @override
     def __init__(
         self,
@@ -106,6 +112,9 @@ class FlextTargetLdapBaseSink(FlextTargetLdapSink):
         super().__init__(target, stream_name, schema, key_properties)
         self._target = target
         self.client: FlextTargetLdapClient | None = None
+        self._ldap_client: FlextTargetLdapClient | None = None
+        self._connection_settings: m.Ldap.ConnectionConfig | None = None
+        self._field_plan: tuple[tuple[str, str], ...] | None = None
         self._processing_result: FlextTargetLdapProcessingResult = (
             FlextTargetLdapProcessingResult()
         )
@@ -161,31 +170,44 @@ class FlextTargetLdapBaseSink(FlextTargetLdapSink):
         })
 
     def process_batch(self, context: t.TargetLdap.RecordPayload) -> None:
-        """Process a batch of records."""
-        setup_result: p.Result[FlextTargetLdapClient] = self.setup_client()
-        if not setup_result.success:
-            logger.error(f"Cannot process batch: {setup_result.error or ''}")
-            return
+        """Process a batch of records over one LDAP session."""
         try:
-            records_raw = context.get(c.TargetLdap.KEY_RECORDS, [])
-            records: list[t.TargetLdap.RecordPayload] = []
-            if isinstance(records_raw, list):
-                records.extend(item for item in records_raw if isinstance(item, dict))
-            logger.info(
-                f"Processing batch of {len(records)} records for stream: {self.stream_name}",
-            )
-            for record in records:
-                if isinstance(record, dict):
-                    normalized_record: t.TargetLdap.MutableRecordPayload = {}
-                    for k, v in record.items():
-                        normalized_record[k] = v
-                    self.process_record(normalized_record, context)
-            logger.info(
-                f"Batch processing completed. Success: {self._processing_result.success_count}, Errors: {self._processing_result.error_count}",
-            )
+            self._process_batch_session(context)
+        except c.EXC_RUNTIME_TYPE:
+            logger.exception("Cannot process batch for stream: %s", self.stream_name)
         finally:
             self.teardown_client()
 
+    def _process_batch_session(self, context: t.TargetLdap.RecordPayload) -> None:
+        """Bind once, then write the batch unless the connection failed."""
+        client = self.ldap_client()
+        with client.session() as connected:
+            if connected.failure:
+                logger.error("Cannot process batch: %s", connected.error or "")
+                return
+            self.client = client
+            self._process_batch_records(context)
+
+    def _process_batch_records(self, context: t.TargetLdap.RecordPayload) -> None:
+        """Write every batch record while the client session stays bound."""
+        records_raw = context.get(c.TargetLdap.KEY_RECORDS, [])
+        records: list[t.TargetLdap.RecordPayload] = []
+        if isinstance(records_raw, list):
+            records.extend(item for item in records_raw if isinstance(item, dict))
+        logger.info(
+            "Processing batch of %d records for stream: %s",
+            len(records),
+            self.stream_name,
+        )
+        for record in records:
+            normalized_record: t.TargetLdap.MutableRecordPayload = dict(record)
+            self.process_record(normalized_record, context)
+        logger.info(
+            "Batch processing completed. Success: %d, Errors: %d",
+            self._processing_result.success_count,
+            self._processing_result.error_count,
+        )
+
     @override
     def process_record(
         self,
@@ -197,7 +219,7 @@ class FlextTargetLdapBaseSink(FlextTargetLdapSink):
             self._processing_result.add_error("LDAP client not initialized")
             return r[bool].fail("LDAP client not initialized")
         try:
-            logger.debug(f"Processing record: {_record!r}")
+            logger.debug("Processing record: %r", _record)
             self._processing_result.add_success()
             return r[bool].ok(value=True)
         except c.EXC_RUNTIME_TYPE as e:
@@ -206,10 +228,10 @@ class FlextTargetLdapBaseSink(FlextTargetLdapSink):
             self._processing_result.add_error(error_msg)
             return r[bool].fail(error_msg)
 
-    def setup_client(self) -> p.Result[FlextTargetLdapClient]:
-        """Set up LDAP client connection."""
-        try:
-            connection_config = {
+    def connection_settings(self) -> m.Ldap.ConnectionConfig:
+        """Return the connection model, built once and reused for every batch."""
+        if self._connection_settings is None:
+            self._connection_settings = m.Ldap.ConnectionConfig.model_validate({
                 c.TargetLdap.KEY_HOST: self._target.settings.get(
                     c.TargetLdap.KEY_HOST,
                     c.TargetLdap.DEFAULT_HOST,
@@ -234,14 +256,38 @@ class FlextTargetLdapBaseSink(FlextTargetLdapSink):
                     c.TargetLdap.KEY_TIMEOUT,
                     c.Ldap.TIMEOUT,
                 ),
-            }
-            self.client = FlextTargetLdapClient(connection_config)
+            })
+        return self._connection_settings
+
+    def ldap_client(self) -> FlextTargetLdapClient:
+        """Return the sink's LDAP client, built once and reused for every batch."""
+        if self._ldap_client is None:
+            self._ldap_client = FlextTargetLdapClient(self.connection_settings())
+        return self._ldap_client
+
+    def field_plan(self) -> tuple[tuple[str, str], ...]:
+        """Return the Singer field to LDAP attribute pairs, resolved once per sink.
+
+        Static sink mappings come first and the configured ``attribute_mapping``
+        follows, so configured attributes still win on conflicts.
+        """
+        if self._field_plan is None:
+            mapping = u.TargetLdap.TypeConversion.extract_attribute_mapping(
+                self._target.settings,
+            )
+            self._field_plan = (*self._FIELD_MAP, *mapping.items())
+        return self._field_plan
+
+    def setup_client(self) -> p.Result[FlextTargetLdapClient]:
+        """Set up LDAP client connection."""
+        try:
+            self.client = self.ldap_client()
             connect_result = self.client.connect()
             if not connect_result.success:
                 return r[FlextTargetLdapClient].fail_op(
                     "LDAP connection", connect_result.error
                 )
-            logger.info(f"LDAP client setup successful for stream: {self.stream_name}")
+            logger.info("LDAP client setup successful for stream: %s", self.stream_name)
             return r[FlextTargetLdapClient].ok(self.client)
         except c.EXC_RUNTIME_TYPE as e:
             error_msg: str = f"LDAP client setup failed: {e}"
@@ -249,11 +295,10 @@ class FlextTargetLdapBaseSink(FlextTargetLdapSink):
             return r[FlextTargetLdapClient].fail(error_msg)
 
     def teardown_client(self) -> None:
-        """Teardown LDAP client connection."""
+        """Drop the sink's client; the batch session already unbound it."""
         if self.client:
-            _ = self.client.disconnect()
             self.client = None
-            logger.info(f"LDAP client disconnected for stream: {self.stream_name}")
+            logger.info("LDAP client disconnected for stream: %s", self.stream_name)
 
     def _persist_entry(
         self,
@@ -294,6 +339,17 @@ class FlextTargetLdapBaseSink(FlextTargetLdapSink):
         self._processing_result.add_error(err)
         return r[bool].fail(err)
 
+    def _map_record_fields(
+        self,
+        record: t.TargetLdap.RecordPayload,
+        attributes: dict[str, list[str]],
+    ) -> None:
+        """Copy mapped record fields into ``attributes`` as LDAP string values."""
+        for singer_field, ldap_attr in self.field_plan():
+            value = record.get(singer_field)
+            if value is not None:
+                attributes[ldap_attr] = FlextTargetLdapClient.to_str_values(value)
+
     def validate_entry(
         self,
         dn: str,
@@ -322,10 +378,22 @@ class FlextTargetLdapBaseSink(FlextTargetLdapSink):
 class FlextTargetLdapUsersSink(FlextTargetLdapBaseSink):
     """LDAP sink for user entries."""
 
+    # Renames applied by build_attributes, which passes other fields through;
+    # _FIELD_MAP instead selects the fields written by build_user_attributes.
     _USER_FIELD_MAP: ClassVar[t.StrMapping] = {
         "emails": "mail",
         "phone_numbers": "telephoneNumber",
     }
+    _FIELD_MAP: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("username", "uid"),
+        ("email", "mail"),
+        ("first_name", "givenName"),
+        ("last_name", "sn"),
+        ("full_name", "cn"),
+        ("phone", "telephoneNumber"),
+        ("department", "departmentNumber"),
+        ("title", "title"),
+    )
 
     @override
     def build_attributes(
@@ -370,27 +438,7 @@ class FlextTargetLdapUsersSink(FlextTargetLdapBaseSink):
         attributes: dict[str, list[str]] = {
             "objectClass": object_classes,
         }
-        field_mapping = {
-            "username": "uid",
-            "email": "mail",
-            "first_name": "givenName",
-            "last_name": "sn",
-            "full_name": "cn",
-            "phone": "telephoneNumber",
-            "department": "departmentNumber",
-            "title": "title",
-        }
-        for singer_field, ldap_attr in field_mapping.items():
-            value = record.get(singer_field)
-            if value is not None:
-                attributes[ldap_attr] = FlextTargetLdapClient.to_str_values(value)
-        mapping = u.TargetLdap.TypeConversion.extract_attribute_mapping(
-            self._target.settings,
-        )
-        for singer_field, mapped_attr in mapping.items():
-            value = record.get(singer_field)
-            if value is not None:
-                attributes[mapped_attr] = FlextTargetLdapClient.to_str_values(value)
+        self._map_record_fields(record, attributes)
         return attributes
 
     @override
@@ -422,18 +470,11 @@ class FlextTargetLdapUsersSink(FlextTargetLdapBaseSink):
                 return r[bool].fail("No username found in record")
             base_dn = self._target.settings.get("base_dn", "dc=example,dc=com")
             attributes = self.build_user_attributes(_record)
-            object_classes = FlextTargetLdapClient.to_str_values(
-                attributes.get("objectClass", ["inetOrgPerson", "person"]),
-            )
-            attributes_dict: dict[str, list[str]] = {
-                key: FlextTargetLdapClient.to_str_values(value)
-                for key, value in attributes.items()
-                if key != "objectClass"
-            }
+            object_classes = attributes.pop("objectClass", ["inetOrgPerson", "person"])
             return self._persist_entry(
                 label="user",
                 dn=f"uid={username},{base_dn}",
-                attributes_dict=attributes_dict,
+                attributes_dict=attributes,
                 object_classes=object_classes,
             )
         except c.EXC_RUNTIME_TYPE as e:
@@ -446,6 +487,12 @@ class FlextTargetLdapUsersSink(FlextTargetLdapBaseSink):
 class FlextTargetLdapGroupsSink(FlextTargetLdapBaseSink):
     """LDAP sink for group entries."""
 
+    _FIELD_MAP: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("name", "cn"),
+        ("description", "description"),
+        ("members", "member"),
+    )
+
     @override
     def build_attributes(
         self,
@@ -496,18 +543,11 @@ class FlextTargetLdapGroupsSink(FlextTargetLdapBaseSink):
                 return r[bool].fail("No group name found in record")
             base_dn = self._target.settings.get("base_dn", "dc=example,dc=com")
             attributes = self._build_group_attributes(_record)
-            object_classes = FlextTargetLdapClient.to_str_values(
-                attributes.get("objectClass", ["groupOfNames"]),
-            )
-            attributes_dict: dict[str, list[str]] = {
-                key: FlextTargetLdapClient.to_str_values(value)
-                for key, value in attributes.items()
-                if key != "objectClass"
-            }
+            object_classes = attributes.pop("objectClass", ["groupOfNames"])
             return self._persist_entry(
                 label="group",
                 dn=f"cn={group_name},{base_dn}",
-                attributes_dict=attributes_dict,
+                attributes_dict=attributes,
                 object_classes=object_classes,
             )
         except c.EXC_RUNTIME_TYPE as e:
@@ -535,28 +575,18 @@ class FlextTargetLdapGroupsSink(FlextTargetLdapBaseSink):
         attributes: dict[str, list[str]] = {
             "objectClass": object_classes,
         }
-        field_mapping = {
-            "name": "cn",
-            "description": "description",
-            "members": "member",
-        }
-        for singer_field, ldap_attr in field_mapping.items():
-            value = record.get(singer_field)
-            if value is not None:
-                attributes[ldap_attr] = FlextTargetLdapClient.to_str_values(value)
-        mapping = u.TargetLdap.TypeConversion.extract_attribute_mapping(
-            self._target.settings,
-        )
-        for singer_field, mapped_attr in mapping.items():
-            value = record.get(singer_field)
-            if value is not None:
-                attributes[mapped_attr] = FlextTargetLdapClient.to_str_values(value)
+        self._map_record_fields(record, attributes)
         return attributes
 
 
 class FlextTargetLdapOrganizationalUnitsSink(FlextTargetLdapBaseSink):
     """LDAP sink for organizational unit entries."""
 
+    _FIELD_MAP: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("name", "ou"),
+        ("description", "description"),
+    )
+
     @override
     def process_record(
         self,
@@ -571,14 +601,10 @@ class FlextTargetLdapOrganizationalUnitsSink(FlextTargetLdapBaseSink):
                 return r[bool].fail("No OU name found in record")
             base_dn = self._target.settings.get("base_dn", "dc=example,dc=com")
             attributes = self._build_ou_attributes(_record)
-            attributes_dict: dict[str, list[str]] = {
-                key: FlextTargetLdapClient.to_str_values(value)
-                for key, value in attributes.items()
-            }
             return self._persist_entry(
                 label="OU",
                 dn=f"ou={ou_name},{base_dn}",
-                attributes_dict=attributes_dict,
+                attributes_dict=attributes,
             )
         except c.EXC_RUNTIME_TYPE as e:
             error_msg: str = f"Error processing OU record: {e}"
@@ -605,18 +631,7 @@ class FlextTargetLdapOrganizationalUnitsSink(FlextTargetLdapBaseSink):
         attributes: dict[str, list[str]] = {
             "objectClass": object_classes,
         }
-        field_mapping = {"name": "ou", "description": "description"}
-        for singer_field, ldap_attr in field_mapping.items():
-            value = record.get(singer_field)
-            if value is not None:
-                attributes[ldap_attr] = FlextTargetLdapClient.to_str_values(value)
-        mapping = u.TargetLdap.TypeConversion.extract_attribute_mapping(
-            self._target.settings,
-        )
-        for singer_field, mapped_attr in mapping.items():
-            value = record.get(singer_field)
-            if value is not None:
-                attributes[mapped_attr] = FlextTargetLdapClient.to_str_values(value)
+        self._map_record_fields(record, attributes)
         return attributes
 
 
@@ -6,11 +6,17 @@ SPDX-License-Identifier: MIT.
 
 from __future__ import annotations
 
+import functools
+import sys
+import threading
+import time
 from collections.abc import (
+    Iterable,
     Mapping,
     Sequence,
 )
-from typing import ClassVar, override
+from types import TracebackType
+from typing import ClassVar, TypeIs, override
 
 from flext_ldap import ldap, u
 from flext_target_ldap import FlextTargetLdapSettings, c, m, p, r, t
@@ -22,16 +28,79 @@ class FlextTargetLdapClient:
     This client delegates LDAP operations to flext-ldap without compatibility layers.
     """
 
+    __slots__ = (
+        "_api",
+        "_bind_dn",
+        "_cache_lock",
+        "_exists_cache",
+        "_password",
+        "settings",
+    )
+
+    class Session:
+        """Context manager returned by ``FlextTargetLdapClient.session()``."""
+
+        __slots__ = ("_client",)
+
+        @override
+        def __init__(self, client: FlextTargetLdapClient) -> None:
+            """Bind the session to the client whose connection it checks out."""
+            self._client = client
+
+        def __enter__(self) -> p.Result[bool]:
+            """Open the client session and return the connection attempt."""
+            return self._client.open_session()
+
+        def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_value: BaseException | None,
+            traceback: TracebackType | None,
+        ) -> None:
+            """Close the client session opened on entry."""
+            self._client.close_session()
+
     logger: ClassVar = u.fetch_logger(__name__)
+    _OK_TRUE: ClassVar[p.Result[bool]] = r[bool].ok(value=True)
+    _OK_FALSE: ClassVar[p.Result[bool]] = r[bool].ok(value=False)
+    _FAIL_DN_REQUIRED: ClassVar[p.Result[bool]] = r[bool].fail("DN required")
+    _OK_NO_ENTRIES: ClassVar[p.Result[Sequence[m.Ldif.Entry]]] = r[
+        Sequence[m.Ldif.Entry]
+    ].ok(())
+    _OK_NO_ENTRY: ClassVar[p.Result[m.Ldif.Entry | None]] = r[m.Ldif.Entry | None].ok(
+        None
+    )
+    _SESSION_LOCK: ClassVar[threading.RLock] = threading.RLock()
+    # flext-ldap holds one process-wide connection, so the session that owns
+    # it is tracked here next to the lock rather than per client instance.
+    _session_depth: ClassVar[int] = 0
+    _session_owner: ClassVar[m.Ldap.ConnectionConfig | None] = None
     settings: m.Ldap.ConnectionConfig
 
     @staticmethod
     def to_str_values(
-        value: t.JsonValue | t.StrSequence,
+        value: t.JsonValue | t.StrSequence | bytes,
     ) -> list[str]:
+        if type(value) is str:
+            return [value]
+        if isinstance(value, list) and FlextTargetLdapClient._all_str(value):
+            return value
+        coerce = FlextTargetLdapClient._coerce_str
         if isinstance(value, Sequence) and not isinstance(value, str | bytes):
-            return [str(item) for item in value]
-        return [str(value)]
+            return [item if type(item) is str else coerce(item) for item in value]
+        return [coerce(value)]
+
+    @staticmethod
+    def _coerce_str(value: object) -> str:
+        """Render one attribute value as text, decoding raw bytes as UTF-8."""
+        if isinstance(value, bytes):
+            return value.decode("utf-8", "surrogateescape")
+        return str(value)
+
+    @staticmethod
+    def _all_str(values: Sequence[object]) -> TypeIs[list[str]]:
+        """Tell whether a value list already holds only plain strings."""
+        return all(type(item) is str for item in values)
 
     @staticmethod
     def _build_ldif_entry(
@@ -39,12 +108,16 @@ class FlextTargetLdapClient:
         attributes: t.Ldap.OperationAttributes,
         object_classes: t.StrSequence | None = None,
     ) -> m.Ldif.Entry:
+        to_str_values = FlextTargetLdapClient.to_str_values
         entry_attributes: dict[str, t.StrSequence] = {
-            key: FlextTargetLdapClient.to_str_values(value)
-            for key, value in attributes.items()
+            key: to_str_values(value) for key, value in attributes.items()
         }
         if object_classes:
-            entry_attributes["objectClass"] = list(object_classes)
+            entry_attributes["objectClass"] = (
+                object_classes
+                if isinstance(object_classes, list)
+                else list(object_classes)
+            )
         return m.Ldif.Entry(
             dn=m.Ldif.DN(
                 value=dn,
@@ -64,17 +137,35 @@ class FlextTargetLdapClient:
     def _build_modify_changes(
         changes: t.Ldap.OperationAttributes,
     ) -> dict[str, t.SequenceOf[tuple[int, t.StrSequence]]]:
+        replace = c.Ldap.ModifyOperation.REPLACE
+        to_str_values = FlextTargetLdapClient.to_str_values
         built_changes: dict[str, t.SequenceOf[tuple[int, t.StrSequence]]] = {
-            key: [
-                (
-                    c.Ldap.ModifyOperation.REPLACE,
-                    FlextTargetLdapClient.to_str_values(value),
-                )
-            ]
-            for key, value in changes.items()
+            key: [(replace, to_str_values(value))] for key, value in changes.items()
         }
         return built_changes
 
+    @staticmethod
+    def _escape_filter_value(value: str) -> str:
+        """Escape an assertion value for an LDAP filter (RFC 4515)."""
+        return (
+            value
+            .replace("\\", "\\5c")
+            .replace("*", "\\2a")
+            .replace("(", "\\28")
+            .replace(")", "\\29")
+            .replace("\x00", "\\00")
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=c.TargetLdap.DN_NORMALIZE_CACHE_SIZE)
+    def _normalize_dn(dn: str) -> str:
+        """Fold a DN for comparison: trim spaces around RDNs and lowercase.
+
+        Results are memoized and interned because a load folds the same DNs
+        on every existence check and cache update.
+        """
+        return sys.intern(",".join(part.strip() for part in dn.split(",")).lower())
+
     @override
     def __init__(
         self,
@@ -90,11 +181,19 @@ class FlextTargetLdapClient:
         self._bind_dn = connection_settings.bind_dn or ""
         self._password = connection_settings.bind_password or ""
         self._api = ldap
-        self._current_session_id: str | None = None
+        self._exists_cache: dict[str, tuple[float, bool]] = {}
+        self._cache_lock = threading.Lock()
         FlextTargetLdapClient.logger.info(
-            f"Initialized LDAP client using flext-ldap API for {self.settings.host}:{self.settings.port}",
+            "Initialized LDAP client using flext-ldap API for %s:%s",
+            connection_settings.host,
+            connection_settings.port,
         )
 
+    @classmethod
+    def from_dict(cls, payload: t.TargetLdap.SettingsPayload) -> FlextTargetLdapClient:
+        """Build a client from a flat or ``connection``-nested settings mapping."""
+        return cls(cls._connection_from_mapping(payload))
+
     @property
     def bind_dn(self) -> str:
         """Get bind DN."""
@@ -125,15 +224,22 @@ class FlextTargetLdapClient:
         if isinstance(settings, FlextTargetLdapSettings):
             return settings.connection
         if isinstance(settings, Mapping):
-            connection_value = settings.get("connection")
-            if isinstance(connection_value, m.Ldap.ConnectionConfig):
-                return connection_value
-            if isinstance(connection_value, Mapping):
-                return m.Ldap.ConnectionConfig.model_validate(connection_value)
-            return m.Ldap.ConnectionConfig.model_validate(settings)
+            return FlextTargetLdapClient._connection_from_mapping(settings)
         msg = f"Unsupported LDAP client settings type: {type(settings).__name__}"
         raise TypeError(msg)
 
+    @staticmethod
+    def _connection_from_mapping(
+        settings: t.TargetLdap.SettingsPayload,
+    ) -> m.Ldap.ConnectionConfig:
+        """Validate the connection model from a flat or nested mapping once."""
+        connection_value = settings.get("connection")
+        if isinstance(connection_value, m.Ldap.ConnectionConfig):
+            return connection_value
+        if isinstance(connection_value, Mapping):
+            return m.Ldap.ConnectionConfig.model_validate(connection_value)
+        return m.Ldap.ConnectionConfig.model_validate(settings)
+
     @property
     def port(self) -> int:
         """Get server port."""
@@ -143,7 +249,7 @@ class FlextTargetLdapClient:
     @property
     def server_uri(self) -> str:
         """Get server URI."""
-        protocol = "ldaps" if self.settings.use_ssl else "ldap"
+        protocol = c.TargetLdap.URI_SCHEMES[self.settings.use_ssl]
         return f"{protocol}://{self.settings.host}:{self.settings.port}"
 
     @property
@@ -166,96 +272,282 @@ class FlextTargetLdapClient:
     ) -> p.Result[bool]:
         """Add LDAP entry using flext-ldap API."""
         try:
-            FlextTargetLdapClient.logger.info(
+            FlextTargetLdapClient.logger.debug(
                 "Adding LDAP entry using flext-ldap API: %s",
                 dn,
             )
-            connect_result = self._api.connect(self.settings)
-            if connect_result.failure:
-                return r[bool].fail_op("Connection", connect_result.error)
-            try:
+            with self.session() as connected:
+                if connected.failure:
+                    return r[bool].fail_op("Connection", connected.error)
                 ldap_entry = self._build_ldif_entry(dn, attributes, object_classes)
                 result_op = self._api.add(ldap_entry)
-                if result_op.success:
-                    return r[bool].ok(value=True)
-                return r[bool].fail(
-                    result_op.error or "LDAP add failed",
-                )
-            finally:
-                self._api.disconnect()
+            if result_op.success:
+                self._remember_exists(dn, exists=True)
+                return FlextTargetLdapClient._OK_TRUE
+            self.invalidate(dn)
+            return r[bool].fail(
+                result_op.error or "LDAP add failed",
+            )
         except c.EXC_RUNTIME_TYPE as e:
             FlextTargetLdapClient.logger.exception("Failed to add entry %s", dn)
             return r[bool].fail_op("Add entry", e)
 
+    def bulk_add_entries(
+        self,
+        entries: Iterable[t.TargetLdap.AddOperation],
+    ) -> list[p.Result[bool]]:
+        """Add many LDAP entries over a single flext-ldap connection.
+
+        Each entry is a ``(dn, attributes, object_classes)`` tuple; results
+        keep the input order.
+        """
+        add = c.TargetLdap.WriteKind.ADD
+        return self.bulk_apply(
+            (add, dn, attributes, object_classes)
+            for dn, attributes, object_classes in entries
+        )
+
+    def bulk_modify_entries(
+        self,
+        changes: Iterable[t.TargetLdap.ModifyOperation],
+    ) -> list[p.Result[bool]]:
+        """Modify many LDAP entries over a single flext-ldap connection.
+
+        Each change is a ``(dn, attributes)`` tuple of replacement values;
+        results keep the input order.
+        """
+        modify = c.TargetLdap.WriteKind.MODIFY
+        return self.bulk_apply(
+            (modify, dn, attributes, None) for dn, attributes in changes
+        )
+
+    def bulk_apply(
+        self,
+        operations: Iterable[t.TargetLdap.WriteOperation],
+    ) -> list[p.Result[bool]]:
+        """Apply many LDAP writes over a single flext-ldap connection.
+
+        Each operation is a ``(kind, dn, attributes, object_classes)`` tuple
+        where ``kind`` is a ``c.TargetLdap.WriteKind`` value. Results keep the
+        input order so callers can report per-record status; an unexpected
+        error ends the batch with one failed result for the operation it hit.
+        """
+        results: list[p.Result[bool]] = []
+        try:
+            with self.session() as connected:
+                if connected.failure:
+                    results.extend(
+                        r[bool].fail_op("Connection", connected.error)
+                        for _ in operations
+                    )
+                    return results
+                results.extend(
+                    self._apply_operation(operation) for operation in operations
+                )
+        except c.EXC_RUNTIME_TYPE as e:
+            FlextTargetLdapClient.logger.exception("Failed to apply LDAP batch")
+            results.append(r[bool].fail_op("Bulk apply", e))
+        return results
+
+    def bulk_delete_entries(self, dns: Iterable[str]) -> list[p.Result[bool]]:
+        """Delete many LDAP entries over a single flext-ldap connection.
+
+        Results keep the input order.
+        """
+        delete = c.TargetLdap.WriteKind.DELETE
+        return self.bulk_apply((delete, dn, {}, None) for dn in dns)
+
     def connect(self) -> p.Result[bool]:
         """Validate connectivity to LDAP server using flext-ldap API."""
         try:
-            connect_result = self._api.connect(self.settings)
-            if connect_result.failure:
-                return r[bool].fail_op("Connection", connect_result.error)
-            self._api.disconnect()
+            with self.session() as connected:
+                if connected.failure:
+                    return r[bool].fail_op("Connection", connected.error)
             FlextTargetLdapClient.logger.info(
-                f"LDAP connectivity validated for {self.settings.host}:{self.settings.port}",
+                "LDAP connectivity validated for %s",
+                self.server_uri,
             )
-            return r[bool].ok(value=True)
+            return FlextTargetLdapClient._OK_TRUE
         except c.Meltano.SINGER_SAFE_EXCEPTIONS as e:
             error_msg = f"Connection error: {e}"
             FlextTargetLdapClient.logger.exception(error_msg)
             return r[bool].fail(error_msg)
 
+    def _apply_operation(
+        self,
+        operation: t.TargetLdap.WriteOperation,
+    ) -> p.Result[bool]:
+        """Dispatch one batched write to the matching single-entry method."""
+        kind, dn, attributes, object_classes = operation
+        match kind:
+            case c.TargetLdap.WriteKind.ADD:
+                return self.add_entry(dn, attributes, object_classes)
+            case c.TargetLdap.WriteKind.MODIFY:
+                return self.modify_entry(dn, attributes)
+            case c.TargetLdap.WriteKind.DELETE:
+                return self.delete_entry(dn)
+
     def delete_entry(self, dn: str) -> p.Result[bool]:
         """Delete LDAP entry using flext-ldap API."""
         try:
             if not dn:
-                return r[bool].fail("DN required")
-            FlextTargetLdapClient.logger.info(
+                return FlextTargetLdapClient._FAIL_DN_REQUIRED
+            FlextTargetLdapClient.logger.debug(
                 "Deleting LDAP entry using flext-ldap API: %s",
                 dn,
             )
-            connect_result = self._api.connect(self.settings)
-            if connect_result.failure:
-                return r[bool].fail_op("Connection", connect_result.error)
-            try:
+            with self.session() as connected:
+                if connected.failure:
+                    return r[bool].fail_op("Connection", connected.error)
                 result = self._api.delete(dn)
-                if result.success:
-                    FlextTargetLdapClient.logger.debug(
-                        "Successfully deleted LDAP entry: %s",
-                        dn,
-                    )
-                    return r[bool].ok(value=True)
-                return r[bool].fail(result.error or "Delete failed")
-            finally:
-                self._api.disconnect()
+            if result.success:
+                self._remember_exists(dn, exists=False)
+                FlextTargetLdapClient.logger.debug(
+                    "Successfully deleted LDAP entry: %s",
+                    dn,
+                )
+                return FlextTargetLdapClient._OK_TRUE
+            self.invalidate(dn)
+            return r[bool].fail(result.error or "Delete failed")
         except c.EXC_RUNTIME_TYPE as e:
             FlextTargetLdapClient.logger.exception("Failed to delete entry %s", dn)
             return r[bool].fail_op("Delete entry", e)
 
     def disconnect(self) -> p.Result[bool]:
-        """Disconnect LDAP session through flext-ldap."""
+        """Disconnect LDAP session through flext-ldap.
+
+        Waits for any checked-out session and leaves an open one alone; the
+        outermost ``session()`` block unbinds it on exit.
+        """
         try:
-            self._api.disconnect()
-            self._current_session_id = None
-            return r[bool].ok(value=True)
+            with FlextTargetLdapClient._SESSION_LOCK:
+                if FlextTargetLdapClient._session_depth > 0:
+                    return FlextTargetLdapClient._OK_TRUE
+                self._api.disconnect()
+            return FlextTargetLdapClient._OK_TRUE
         except c.EXC_RUNTIME_TYPE as e:
             FlextTargetLdapClient.logger.exception(
                 "Failed to disconnect LDAP client",
             )
             return r[bool].fail_op("Disconnect", e)
 
+    def entries_exist(self, dns: Iterable[str]) -> p.Result[dict[str, bool]]:
+        """Check many DNs with OR-filtered one-level searches per parent container.
+
+        Cached answers are reused and every input DN gets its own key in the
+        result, even when several differ only in case. DNs whose RDN cannot be
+        expressed as a simple filter fall back to a single base-scope probe.
+        """
+        exists: dict[str, bool] = {}
+        by_parent: dict[str, dict[str, tuple[list[str], str]]] = {}
+        single: list[str] = []
+        for dn in dns:
+            if not dn:
+                return r[dict[str, bool]].fail("DN required")
+            cached = self._cached_exists(dn)
+            if cached is not None:
+                exists[dn] = cached
+                continue
+            rdn, _, parent = dn.partition(",")
+            attribute, separator, value = rdn.partition("=")
+            if not separator or not parent or "+" in rdn or "\\" in dn:
+                single.append(dn)
+                continue
+            wanted = by_parent.setdefault(parent, {})
+            normalized_dn = self._normalize_dn(dn)
+            if normalized_dn in wanted:
+                wanted[normalized_dn][0].append(dn)
+                continue
+            wanted[normalized_dn] = (
+                [dn],
+                f"({attribute.strip()}={self._escape_filter_value(value.strip())})",
+            )
+        if not by_parent and not single:
+            return r[dict[str, bool]].ok(exists)
+        try:
+            with self.session() as connected:
+                if connected.failure:
+                    return r[dict[str, bool]].fail_op("Connection", connected.error)
+                lookup = self._lookup_exists(by_parent, single, exists)
+        except c.EXC_RUNTIME_TYPE as e:
+            FlextTargetLdapClient.logger.exception("Failed to check entry existence")
+            return r[dict[str, bool]].fail_op("Entries exist check", e)
+        if lookup.failure:
+            return r[dict[str, bool]].fail(lookup.error or "Search failed")
+        return r[dict[str, bool]].ok(exists)
+
+    def _lookup_exists(
+        self,
+        by_parent: Mapping[str, Mapping[str, tuple[list[str], str]]],
+        single: Sequence[str],
+        exists: dict[str, bool],
+    ) -> p.Result[bool]:
+        """Search every parent chunk and probe each single DN inside a session."""
+        chunk_size = c.TargetLdap.EXISTS_FILTER_CHUNK
+        for parent, wanted in by_parent.items():
+            pending = list(wanted.items())
+            for start in range(0, len(pending), chunk_size):
+                chunk_result = self._children_exist(
+                    parent,
+                    pending[start : start + chunk_size],
+                    exists,
+                )
+                if chunk_result.failure:
+                    return chunk_result
+        for dn in single:
+            single_result = self.entry_exists(dn)
+            if single_result.failure:
+                return r[bool].fail(
+                    single_result.error or "Entry exists check failed",
+                )
+            exists[dn] = single_result.value
+        return FlextTargetLdapClient._OK_TRUE
+
+    def _children_exist(
+        self,
+        parent: str,
+        wanted: Sequence[tuple[str, tuple[list[str], str]]],
+        exists: dict[str, bool],
+    ) -> p.Result[bool]:
+        """Resolve one chunk of direct children of ``parent`` with one search."""
+        search_result = self._search_entries(
+            parent,
+            f"(|{''.join(query for _, (_, query) in wanted)})",
+            [c.TargetLdap.NO_ATTRIBUTES],
+            scope=c.Ldap.Ldap3SearchScope.ONELEVEL,
+            size_limit=0,
+        )
+        if search_result.failure:
+            return r[bool].fail(search_result.error or "Search failed")
+        present = {
+            self._normalize_dn(entry.dn.value)
+            for entry in search_result.value
+            if entry.dn is not None
+        }
+        for normalized_dn, (raw_dns, _) in wanted:
+            found = normalized_dn in present
+            self._remember_exists(raw_dns[0], exists=found)
+            for dn in raw_dns:
+                exists[dn] = found
+        return FlextTargetLdapClient._OK_TRUE
+
     def entry_exists(self, dn: str) -> p.Result[bool]:
         """Check if LDAP entry exists using flext-ldap API."""
         try:
             if not dn:
-                return r[bool].fail("DN required")
-            FlextTargetLdapClient.logger.info("Checking if LDAP entry exists: %s", dn)
-            search_result = self.search_entry(
-                base_dn=dn,
-                search_filter="(objectClass=*)",
-                attributes=["dn"],
-            )
-            if search_result.success:
-                return r[bool].ok(bool(search_result.value))
-            return r[bool].ok(value=False)
+                return FlextTargetLdapClient._FAIL_DN_REQUIRED
+            cached = self._cached_exists(dn)
+            if cached is not None:
+                return (
+                    FlextTargetLdapClient._OK_TRUE
+                    if cached
+                    else FlextTargetLdapClient._OK_FALSE
+                )
+            FlextTargetLdapClient.logger.debug("Checking if LDAP entry exists: %s", dn)
+            found = self._search_one(dn, [c.TargetLdap.NO_ATTRIBUTES])
+            if found.success and found.value is not None:
+                return FlextTargetLdapClient._OK_TRUE
+            return FlextTargetLdapClient._OK_FALSE
         except c.EXC_RUNTIME_TYPE as e:
             FlextTargetLdapClient.logger.exception(
                 "Failed to check entry existence: %s",
@@ -272,15 +564,43 @@ class FlextTargetLdapClient:
         try:
             if not dn:
                 return r[m.Ldif.Entry | None].fail("DN required")
-            FlextTargetLdapClient.logger.info("Getting LDAP entry: %s", dn)
-            search_result = self.search_entry(dn, "(objectClass=*)", attributes)
-            if search_result.success and search_result.value:
-                return r[m.Ldif.Entry | None].ok(search_result.value[0])
-            return r[m.Ldif.Entry | None].ok(None)
+            if self._cached_exists(dn) is False:
+                return FlextTargetLdapClient._OK_NO_ENTRY
+            FlextTargetLdapClient.logger.debug("Getting LDAP entry: %s", dn)
+            found = self._search_one(dn, attributes)
+            return found if found.success else FlextTargetLdapClient._OK_NO_ENTRY
         except c.EXC_RUNTIME_TYPE as e:
             FlextTargetLdapClient.logger.exception("Failed to get entry: %s", dn)
             return r[m.Ldif.Entry | None].fail_op("Get entry", e)
 
+    def _search_one(
+        self,
+        dn: str,
+        attributes: t.StrSequence | None,
+    ) -> p.Result[m.Ldif.Entry | None]:
+        """Read ``dn`` itself with one base-scope search and cache whether it exists.
+
+        Shared by ``entry_exists`` and ``get_entry`` so either call answers the
+        other's existence question from the cache instead of searching again.
+        A failed search is returned as is and leaves the cache untouched.
+        """
+        search_result = self._search_entries(
+            dn,
+            c.Ldap.ALL_ENTRIES_FILTER,
+            attributes,
+            scope=c.Ldap.Ldap3SearchScope.BASE,
+            size_limit=1,
+        )
+        if search_result.failure:
+            return r[m.Ldif.Entry | None].fail(
+                search_result.error or "LDAP search failed"
+            )
+        entries = search_result.value
+        self._remember_exists(dn, exists=bool(entries))
+        if not entries:
+            return FlextTargetLdapClient._OK_NO_ENTRY
+        return r[m.Ldif.Entry | None].ok(entries[0])
+
     def modify_entry(
         self,
         dn: str,
@@ -288,23 +608,22 @@ class FlextTargetLdapClient:
     ) -> p.Result[bool]:
         """Modify LDAP entry using flext-ldap API."""
         try:
-            FlextTargetLdapClient.logger.info(
+            FlextTargetLdapClient.logger.debug(
                 "Modifying LDAP entry using flext-ldap API: %s",
                 dn,
             )
-            connect_result = self._api.connect(self.settings)
-            if connect_result.failure:
-                return r[bool].fail_op("Connection", connect_result.error)
-            try:
+            with self.session() as connected:
+                if connected.failure:
+                    return r[bool].fail_op("Connection", connected.error)
                 result = self._api.modify(dn, self._build_modify_changes(changes))
-                if result.success:
-                    FlextTargetLdapClient.logger.debug(
-                        "Successfully modified LDAP entry: %s",
-                        dn,
-                    )
-                    return r[bool].ok(value=True)
-            finally:
-                self._api.disconnect()
+            if result.success:
+                self._remember_exists(dn, exists=True)
+                FlextTargetLdapClient.logger.debug(
+                    "Successfully modified LDAP entry: %s",
+                    dn,
+                )
+                return FlextTargetLdapClient._OK_TRUE
+            self.invalidate(dn)
             error_msg = f"Failed to modify entry {dn}: {result.error}"
             FlextTargetLdapClient.logger.error(error_msg)
             return r[bool].fail(error_msg)
@@ -315,49 +634,170 @@ class FlextTargetLdapClient:
     def search_entry(
         self,
         base_dn: str,
-        search_filter: str = "(objectClass=*)",
+        search_filter: str = c.Ldap.ALL_ENTRIES_FILTER,
         attributes: t.StrSequence | None = None,
+        *,
+        scope: c.Ldap.Ldap3SearchScope = c.Ldap.DEFAULT_SCOPE,
+        size_limit: int = 0,
     ) -> p.Result[list[m.Ldif.Entry]]:
         """Search LDAP entries using flext-ldap API."""
+        result = self._search_entries(
+            base_dn,
+            search_filter,
+            attributes,
+            scope=scope,
+            size_limit=size_limit,
+        )
+        if result.failure:
+            return r[list[m.Ldif.Entry]].fail(result.error or "Search failed")
+        entries = result.value
+        if not isinstance(entries, list):
+            entries = list(entries)
+        FlextTargetLdapClient.logger.debug(
+            "Successfully found %d LDAP entries",
+            len(entries),
+        )
+        return r[list[m.Ldif.Entry]].ok(entries)
+
+    def _search_entries(
+        self,
+        base_dn: str,
+        search_filter: str,
+        attributes: t.StrSequence | None,
+        *,
+        scope: c.Ldap.Ldap3SearchScope,
+        size_limit: int,
+    ) -> p.Result[Sequence[m.Ldif.Entry]]:
+        """Run one flext-ldap search and hand back its entry sequence as is."""
         try:
             if not base_dn:
-                return r[list[m.Ldif.Entry]].fail("Base DN required")
-            FlextTargetLdapClient.logger.info(
+                return r[Sequence[m.Ldif.Entry]].fail("Base DN required")
+            FlextTargetLdapClient.logger.debug(
                 "Searching LDAP entries using flext-ldap API: %s with filter %s",
                 base_dn,
                 search_filter,
             )
-            connect_result = self._api.connect(self.settings)
-            if connect_result.failure:
-                return r[list[m.Ldif.Entry]].fail_op(
-                    "Connection",
-                    connect_result.error,
-                )
-            try:
+            with self.session() as connected:
+                if connected.failure:
+                    return r[Sequence[m.Ldif.Entry]].fail_op(
+                        "Connection",
+                        connected.error,
+                    )
                 search_options = m.Ldap.SearchOptions(
                     base_dn=base_dn,
                     filter_str=search_filter,
                     attributes=attributes,
+                    scope=scope,
+                    size_limit=size_limit,
                 )
                 result = self._api.search(search_options)
-            finally:
-                self._api.disconnect()
-            if result.success and result.value:
-                search_res = result.value
-                entries: list[m.Ldif.Entry] = list(search_res.entries)
-                FlextTargetLdapClient.logger.debug(
-                    "Successfully found %d LDAP entries",
-                    len(entries),
+            if not result.success:
+                return r[Sequence[m.Ldif.Entry]].fail(
+                    result.error or "LDAP search failed",
                 )
-                return r[list[m.Ldif.Entry]].ok(entries)
+            if result.value:
+                return r[Sequence[m.Ldif.Entry]].ok(result.value.entries)
             FlextTargetLdapClient.logger.debug("No LDAP entries found")
-            return r[list[m.Ldif.Entry]].ok([])
+            return FlextTargetLdapClient._OK_NO_ENTRIES
         except c.EXC_RUNTIME_TYPE as e:
             FlextTargetLdapClient.logger.exception(
                 "Failed to search entries in %s",
                 base_dn,
             )
-            return r[list[m.Ldif.Entry]].fail_op("Search", e)
+            return r[Sequence[m.Ldif.Entry]].fail_op("Search", e)
+
+    def invalidate(self, dn: str | None = None) -> None:
+        """Forget the cached existence of ``dn``, or of every DN when omitted."""
+        if dn is None:
+            with self._cache_lock:
+                self._exists_cache.clear()
+            return
+        key = self._normalize_dn(dn)
+        with self._cache_lock:
+            self._exists_cache.pop(key, None)
+
+    def _cached_exists(self, dn: str) -> bool | None:
+        """Return the cached existence of ``dn``, or ``None`` when unknown."""
+        key = self._normalize_dn(dn)
+        with self._cache_lock:
+            cached = self._exists_cache.get(key)
+            if cached is None:
+                return None
+            expires_at, exists = cached
+            if expires_at < time.monotonic():
+                self._exists_cache.pop(key, None)
+                return None
+            return exists
+
+    def _remember_exists(self, dn: str, *, exists: bool) -> None:
+        """Record what the server or a successful write said about ``dn``."""
+        key = self._normalize_dn(dn)
+        ttl = (
+            c.TargetLdap.EXISTS_CACHE_TTL if exists else c.TargetLdap.MISSING_CACHE_TTL
+        )
+        with self._cache_lock:
+            cache = self._exists_cache
+            if key not in cache and len(cache) >= c.TargetLdap.EXISTS_CACHE_MAXSIZE:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = (time.monotonic() + ttl, exists)
+
+    def session(self) -> FlextTargetLdapClient.Session:
+        """Hold one flext-ldap connection open across the enclosed operations.
+
+        Operations issued inside the block reuse the bound connection instead
+        of connecting and disconnecting per call; nested blocks share it.
+        flext-ldap drives a single process-wide connection, so threads check
+        it out one at a time instead of unbinding each other mid-operation.
+        Entering yields a ``p.Result[bool]`` for the connection attempt.
+        """
+        return FlextTargetLdapClient.Session(self)
+
+    def open_session(self) -> p.Result[bool]:
+        """Take the session lock and connect unless a session is already open.
+
+        Every call, successful or not, must be paired with ``close_session``;
+        use ``session()`` rather than calling the pair directly. A session
+        opened while a client with different connection settings holds the
+        process-wide connection fails instead of rebinding it.
+        """
+        FlextTargetLdapClient._SESSION_LOCK.acquire()
+        FlextTargetLdapClient._session_depth += 1
+        owner = FlextTargetLdapClient._session_owner
+        if owner is not None:
+            if owner == self.settings:
+                return FlextTargetLdapClient._OK_TRUE
+            return r[bool].fail(
+                "LDAP session already bound for different connection settings",
+            )
+        try:
+            connect_result = self._api.connect(self.settings)
+        except BaseException:
+            FlextTargetLdapClient._session_depth -= 1
+            FlextTargetLdapClient._SESSION_LOCK.release()
+            raise
+        if connect_result.failure:
+            return r[bool].fail(connect_result.error or "LDAP connection failed")
+        FlextTargetLdapClient._session_owner = self.settings
+        return FlextTargetLdapClient._OK_TRUE
+
+    def close_session(self) -> None:
+        """Disconnect when the outermost session closes, then release the lock."""
+        try:
+            FlextTargetLdapClient._session_depth -= 1
+            if (
+                FlextTargetLdapClient._session_depth == 0
+                and FlextTargetLdapClient._session_owner is not None
+            ):
+                FlextTargetLdapClient._session_owner = None
+                try:
+                    self._api.disconnect()
+                except c.EXC_RUNTIME_TYPE as e:
+                    FlextTargetLdapClient.logger.warning(
+                        "Failed to release LDAP session: %s",
+                        e,
+                    )
+        finally:
+            FlextTargetLdapClient._SESSION_LOCK.release()
 
 
 __all__: list[str] = ["FlextTargetLdapClient"]
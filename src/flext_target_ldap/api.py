@@ -175,19 +175,60 @@ class FlextTargetLdap(FlextTargetLdapTarget):
         else:
             dn = dn_text
         if record.get("_sdc_deleted_at"):
-            api.delete_entry(dn)
-            return
-        try:
-            if dn in seen_dns:
-                api.modify_entry(dn, attributes)
-            else:
-                api.add_entry(dn, attributes, object_classes)
+            result = api.delete_entry(dn)
+        elif dn in seen_dns:
+            result = api.modify_entry(dn, attributes)
+        else:
+            result = api.add_entry(dn, attributes, object_classes)
+            if result.failure:
+                result = api.modify_entry(dn, attributes)
+            if result.success:
                 seen_dns.add(dn)
-        except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
+        if result.failure:
             FlextTargetLdap.logger.warning(
-                f"Failed to add entry {dn}, attempting modify: {exc}"
+                "Failed to write LDAP entry %s: %s",
+                dn,
+                result.error,
             )
-            api.modify_entry(dn, attributes)
+
+    @staticmethod
+    def _flush_records(
+        pending: list[tuple[t.TargetLdap.MutableRecordPayload, str]],
+        cfg: FlextTargetLdapSettings,
+        api: FlextTargetLdapClient,
+        seen_dns: set[str],
+    ) -> None:
+        """Write buffered RECORD messages over one fresh LDAP session.
+
+        Binding per flush rather than per stream means an idle or dropped
+        connection never outlives one chunk of records. The buffer is emptied
+        even when the flush fails, so a failed chunk is logged once and never
+        replayed with the next one.
+        """
+        if not pending:
+            return
+        try:
+            with api.session() as connected:
+                if connected.failure:
+                    FlextTargetLdap.logger.warning(
+                        "LDAP session unavailable, connecting per record: %s",
+                        connected.error,
+                    )
+                for record, stream in pending:
+                    FlextTargetLdap._process_record_message(
+                        record,
+                        stream,
+                        cfg,
+                        api,
+                        seen_dns,
+                    )
+        except c.EXC_RUNTIME_TYPE:
+            FlextTargetLdap.logger.exception(
+                "Failed to flush %d LDAP records",
+                len(pending),
+            )
+        finally:
+            pending.clear()
 
     @staticmethod
     def run_cli(settings: str | None = None) -> None:
@@ -200,11 +241,15 @@ class FlextTargetLdap(FlextTargetLdapTarget):
             current_stream: str | None = None
             api = FlextTargetLdapClient(validated_settings)
             seen_dns: set[str] = set()
+            pending: list[tuple[t.TargetLdap.MutableRecordPayload, str]] = []
             for line in sys.stdin:
                 try:
                     raw = t.Cli.JSON_MAPPING_ADAPTER.validate_json(line)
                     msg_type = raw.get("type")
                     if msg_type == "STATE":
+                        FlextTargetLdap._flush_records(
+                            pending, validated_settings, api, seen_dns
+                        )
                         FlextTargetLdap.logger.debug(line.strip())
                         continue
                     if msg_type == "SCHEMA":
@@ -224,19 +269,15 @@ class FlextTargetLdap(FlextTargetLdapTarget):
                     )
                     if not isinstance(record_data, Mapping):
                         continue
-                    normalized_record: t.TargetLdap.MutableRecordPayload = {}
-                    for key, value in record_data.items():
-                        normalized_record[key] = value
-                    FlextTargetLdap._process_record_message(
-                        normalized_record,
-                        stream,
-                        validated_settings,
-                        api,
-                        seen_dns,
-                    )
+                    pending.append((dict(record_data), stream))
+                    if len(pending) >= validated_settings.batch_size:
+                        FlextTargetLdap._flush_records(
+                            pending, validated_settings, api, seen_dns
+                        )
                 except c.Meltano.SINGER_SAFE_EXCEPTIONS:
                     FlextTargetLdap.logger.exception("Malformed input line failed")
                     raise
+            FlextTargetLdap._flush_records(pending, validated_settings, api, seen_dns)
         except c.Meltano.SINGER_SAFE_EXCEPTIONS:
             FlextTargetLdap.logger.exception("Unexpected error in CLI execution")
             raise
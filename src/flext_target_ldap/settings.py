@@ -42,53 +42,22 @@ class FlextTargetLdapSettings(FlextSettingsBase):
             return data
 
         normalized = t.json_dict_adapter().validate_python(data)
-        bind_password = normalized.get("bind_password", normalized.get("password"))
         search_scope = normalized.get("search_scope")
         if isinstance(search_scope, str):
             normalized["search_scope"] = search_scope.upper()
-        connection_config = m.Ldap.ConnectionConfig.model_validate({
-            "host": normalized.get("host", c.LOCALHOST),
-            "port": normalized.get("port", c.Ldap.PORT),
-            "use_ssl": normalized.get(
-                "use_ssl",
-                c.Ldap.DEFAULT_USE_SSL,
-            ),
-            "use_tls": normalized.get(
-                "use_tls",
-                c.Ldap.DEFAULT_USE_TLS,
-            ),
-            "bind_dn": normalized.get(
-                "bind_dn",
-                c.Ldap.DEFAULT_BIND_DN,
-            ),
-            "bind_password": bind_password,
-            "timeout": normalized.get(
-                "timeout",
-                c.Ldap.TIMEOUT,
-            ),
-            "auto_bind": normalized.get(
-                "auto_bind",
-                c.Ldap.AUTO_BIND,
-            ),
-            "auto_range": normalized.get(
-                "auto_range",
-                c.Ldap.AUTO_RANGE,
-            ),
-        })
-        for consumed_key in (
-            "host",
-            "port",
-            "use_ssl",
-            "use_tls",
-            "bind_dn",
-            "bind_password",
-            "password",
-            "timeout",
-            "auto_bind",
-            "auto_range",
-        ):
-            normalized.pop(consumed_key, None)
-        normalized["connection"] = connection_config.model_dump(mode="python")
+        password = normalized.pop("password", None)
+        connection_payload: t.JsonMapping = {
+            "host": normalized.pop("host", c.LOCALHOST),
+            "port": normalized.pop("port", c.Ldap.PORT),
+            "use_ssl": normalized.pop("use_ssl", c.Ldap.DEFAULT_USE_SSL),
+            "use_tls": normalized.pop("use_tls", c.Ldap.DEFAULT_USE_TLS),
+            "bind_dn": normalized.pop("bind_dn", c.Ldap.DEFAULT_BIND_DN),
+            "bind_password": normalized.pop("bind_password", password),
+            "timeout": normalized.pop("timeout", c.Ldap.TIMEOUT),
+            "auto_bind": normalized.pop("auto_bind", c.Ldap.AUTO_BIND),
+            "auto_range": normalized.pop("auto_range", c.Ldap.AUTO_RANGE),
+        }
+        normalized["connection"] = connection_payload
         return normalized
 
     connection: Annotated[
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from flext_ldap import FlextLdapTypes
 from flext_meltano import t
 
+if TYPE_CHECKING:
+    from flext_target_ldap._constants.base import FlextTargetLdapConstantsBase
+
 
 class FlextTargetLdapTypes(t, FlextLdapTypes):
     """MRO facade composing Meltano + LDAP type namespaces."""
@@ -18,6 +23,18 @@ class FlextTargetLdapTypes(t, FlextLdapTypes):
         type SchemaPayload = t.JsonMapping
         type MutableSchemaPayload = t.MutableJsonMapping
         type CatalogPayload = t.JsonMapping
+        type AddOperation = tuple[
+            str,
+            FlextLdapTypes.Ldap.OperationAttributes,
+            t.StrSequence | None,
+        ]
+        type ModifyOperation = tuple[str, FlextLdapTypes.Ldap.OperationAttributes]
+        type WriteOperation = tuple[
+            FlextTargetLdapConstantsBase.WriteKind,
+            str,
+            FlextLdapTypes.Ldap.OperationAttributes,
+            t.StrSequence | None,
+        ]
 
 
 t = FlextTargetLdapTypes
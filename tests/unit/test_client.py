@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock
 
 import pytest
 from flext_tests import r
 
 from flext_target_ldap._utilities.client import FlextTargetLdapClient
+from tests.constants import c
 from tests.models import m
 from tests.typings import t
 
@@ -163,3 +165,424 @@ class TestsFlextTargetLdapClient:
         result = client.search_entry("dc=test,dc=com")
         assert result.success
         client._api.disconnect.assert_called_once()
+
+    def test_bulk_apply_reuses_single_connection(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.add.return_value = MagicMock(success=True, error=None)
+        client._api.modify.return_value = MagicMock(success=True, error=None)
+        client._api.delete.return_value = MagicMock(success=True, error=None)
+        results = client.bulk_apply([
+            (c.TargetLdap.WriteKind.ADD, "uid=a,dc=test,dc=com", {"cn": "A"}, None),
+            (c.TargetLdap.WriteKind.MODIFY, "uid=b,dc=test,dc=com", {"cn": "B"}, None),
+            (c.TargetLdap.WriteKind.DELETE, "uid=c,dc=test,dc=com", {}, None),
+        ])
+        assert [result.success for result in results] == [True, True, True]
+        client._api.connect.assert_called_once_with(client.settings)
+        client._api.disconnect.assert_called_once()
+
+    def test_bulk_add_entries_share_one_connection(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.add.return_value = MagicMock(success=True, error=None)
+        results = client.bulk_add_entries([
+            ("uid=a,dc=test,dc=com", {"cn": "A"}, ["person"]),
+            ("uid=b,dc=test,dc=com", {"cn": "B"}, None),
+        ])
+        assert [result.success for result in results] == [True, True]
+        assert client._api.add.call_count == 2
+        client._api.connect.assert_called_once_with(client.settings)
+        client._api.disconnect.assert_called_once()
+
+    def test_bulk_modify_entries_share_one_connection(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.modify.return_value = MagicMock(success=True, error=None)
+        results = client.bulk_modify_entries([
+            ("uid=a,dc=test,dc=com", {"cn": "A"}),
+            ("uid=b,dc=test,dc=com", {"cn": "B"}),
+        ])
+        assert [result.success for result in results] == [True, True]
+        assert client._api.modify.call_count == 2
+        client._api.connect.assert_called_once_with(client.settings)
+
+    def test_bulk_apply_reports_connection_failure_per_operation(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].fail("unreachable")
+        results = client.bulk_delete_entries([
+            "uid=a,dc=test,dc=com",
+            "uid=b,dc=test,dc=com",
+        ])
+        assert len(results) == 2
+        assert all(result.failure for result in results)
+        client._api.delete.assert_not_called()
+        client._api.disconnect.assert_not_called()
+
+    def test_bulk_apply_reports_unexpected_error_as_failure(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.side_effect = RuntimeError("refused")
+        results = client.bulk_delete_entries(["uid=a,dc=test,dc=com"])
+        assert len(results) == 1
+        assert results[0].failure
+        client._api.delete.assert_not_called()
+
+    def test_session_shares_connection_across_operations(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.delete.return_value = MagicMock(success=True, error=None)
+        with client.session() as connected:
+            assert connected.success
+            assert client.delete_entry("uid=a,dc=test,dc=com").success
+            assert client.delete_entry("uid=b,dc=test,dc=com").success
+            client._api.disconnect.assert_not_called()
+        client._api.connect.assert_called_once_with(client.settings)
+        client._api.disconnect.assert_called_once()
+
+    def test_session_is_a_separate_slotted_context(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        session = client.session()
+        assert isinstance(session, FlextTargetLdapClient.Session)
+        assert not hasattr(session, "__dict__")
+        assert not hasattr(client, "__enter__")
+
+    def test_session_connect_error_releases_checkout(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.side_effect = [RuntimeError("refused"), r[bool].ok(True)]
+        with pytest.raises(RuntimeError), client.session():
+            pass
+        with client.session() as connected:
+            assert connected.success
+        client._api.disconnect.assert_called_once()
+
+    def test_session_state_shared_across_client_instances(
+        self,
+        client: FlextTargetLdapClient,
+        mock_ldap_config: t.TargetLdap.SettingsPayload,
+    ) -> None:
+        twin = FlextTargetLdapClient(mock_ldap_config)
+        other = FlextTargetLdapClient({**mock_ldap_config, "host": "other.ldap.com"})
+        api = MagicMock()
+        api.connect.return_value = r[bool].ok(True)
+        client._api = twin._api = other._api = api
+        with client.session() as connected:
+            assert connected.success
+            with twin.session() as nested:
+                assert nested.success
+            with other.session() as foreign:
+                assert foreign.failure
+            api.disconnect.assert_not_called()
+        api.connect.assert_called_once_with(client.settings)
+        api.disconnect.assert_called_once()
+
+    def test_disconnect_leaves_open_session_to_its_owner(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        with client.session():
+            assert client.disconnect().success
+            client._api.disconnect.assert_not_called()
+        client._api.disconnect.assert_called_once()
+
+    def test_session_teardown_failure_keeps_operation_result(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.delete.return_value = MagicMock(success=True, error=None)
+        client._api.disconnect.side_effect = RuntimeError("socket closed")
+        result = client.delete_entry("uid=test,dc=test,dc=com")
+        assert result.success
+        assert result.value is True
+
+    def test_entry_exists_requests_no_attributes(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=True,
+            value=MagicMock(entries=[{"dn": "uid=test,dc=test,dc=com"}]),
+        )
+        result = client.entry_exists("uid=test,dc=test,dc=com")
+        assert result.success
+        assert result.value is True
+        search_options = client._api.search.call_args.args[0]
+        assert search_options.attributes == [c.TargetLdap.NO_ATTRIBUTES]
+        assert search_options.scope == c.Ldap.Ldap3SearchScope.BASE
+        assert search_options.size_limit == 1
+
+    def test_client_instances_have_no_attribute_dict(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        assert not hasattr(client, "__dict__")
+
+    def test_get_entry_uses_base_scope_lookup(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        entry = m.Ldif.Entry(
+            dn=m.Ldif.DN(value="uid=test,dc=test,dc=com"),
+            attributes=m.Ldif.Attributes(attributes={"cn": ["Test User"]}),
+        )
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=True,
+            value=MagicMock(entries=[entry]),
+        )
+        result = client.get_entry("uid=test,dc=test,dc=com")
+        assert result.success
+        assert result.value == entry
+        search_options = client._api.search.call_args.args[0]
+        assert search_options.base_dn == "uid=test,dc=test,dc=com"
+        assert search_options.size_limit == 1
+
+    def test_from_dict_builds_connection_settings(
+        self, mock_ldap_config: t.TargetLdap.SettingsPayload
+    ) -> None:
+        client = FlextTargetLdapClient.from_dict(mock_ldap_config)
+        assert client.host == "test.ldap.com"
+        assert client.port == 389
+        assert client.bind_dn == "cn=REDACTED_LDAP_BIND_PASSWORD,dc=test,dc=com"
+
+    def test_connect_inside_session_skips_new_connection(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        with client.session():
+            assert client.connect().success
+        client._api.connect.assert_called_once_with(client.settings)
+
+    def test_entry_exists_cached_and_refreshed_by_writes(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        dn = "uid=test,dc=test,dc=com"
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=True,
+            value=MagicMock(entries=[{"dn": dn}]),
+        )
+        client._api.delete.return_value = MagicMock(success=True, error=None)
+        assert client.entry_exists(dn).value is True
+        assert client.entry_exists(dn).value is True
+        client._api.search.assert_called_once()
+        assert client.delete_entry(dn).success
+        assert client.entry_exists(dn).value is False
+        get_result = client.get_entry(dn)
+        assert get_result.success
+        assert get_result.value is None
+        client._api.search.assert_called_once()
+
+    def test_session_checkout_serializes_threads(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        bound: list[bool] = []
+
+        def connect(_settings: object) -> r[bool]:
+            bound.append(True)
+            return r[bool].ok(True)
+
+        def delete(_dn: str) -> MagicMock:
+            return MagicMock(success=len(bound) == 1, error="overlapping session")
+
+        client._api = MagicMock()
+        client._api.connect.side_effect = connect
+        client._api.disconnect.side_effect = bound.pop
+        client._api.delete.side_effect = delete
+        results: list[bool] = []
+        threads = [
+            threading.Thread(
+                target=lambda dn=f"uid=user{index},dc=test,dc=com": results.append(
+                    client.delete_entry(dn).success
+                ),
+            )
+            for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [True] * 8
+        assert client._api.connect.call_count == 8
+
+    def test_to_str_values_reuses_plain_string_lists(self) -> None:
+        members = ["uid=a,dc=test,dc=com", "uid=b,dc=test,dc=com"]
+        assert FlextTargetLdapClient.to_str_values(members) is members
+        assert FlextTargetLdapClient.to_str_values(["a", 1, True]) == ["a", "1", "True"]
+        assert FlextTargetLdapClient.to_str_values("a") == ["a"]
+        assert FlextTargetLdapClient.to_str_values(42) == ["42"]
+
+    def test_search_entry_returns_server_entry_list_without_copy(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        entries = [
+            m.Ldif.Entry(
+                dn=m.Ldif.DN(value="uid=test,dc=test,dc=com"),
+                attributes=m.Ldif.Attributes(attributes={"cn": ["Test User"]}),
+            ),
+        ]
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=True,
+            value=MagicMock(entries=entries),
+        )
+        result = client.search_entry("dc=test,dc=com")
+        assert result.success
+        assert result.value is entries
+
+    def test_entries_exist_uses_one_search_per_parent(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=True,
+            value=MagicMock(
+                entries=[
+                    m.Ldif.Entry(
+                        dn=m.Ldif.DN(value="uid=alice, ou=people,dc=test,dc=com"),
+                        attributes=m.Ldif.Attributes(attributes={}),
+                    ),
+                ],
+            ),
+        )
+        result = client.entries_exist([
+            "uid=alice,ou=people,dc=test,dc=com",
+            "uid=bob,ou=people,dc=test,dc=com",
+        ])
+        assert result.success
+        assert result.value == {
+            "uid=alice,ou=people,dc=test,dc=com": True,
+            "uid=bob,ou=people,dc=test,dc=com": False,
+        }
+        search_options = client._api.search.call_args.args[0]
+        assert search_options.base_dn == "ou=people,dc=test,dc=com"
+        assert search_options.filter_str == "(|(uid=alice)(uid=bob))"
+        assert search_options.scope == c.Ldap.Ldap3SearchScope.ONELEVEL
+        client._api.search.assert_called_once()
+        client._api.connect.assert_called_once_with(client.settings)
+        assert client.entry_exists("uid=bob,ou=people,dc=test,dc=com").value is False
+        client._api.search.assert_called_once()
+
+    def test_exists_cache_folds_dn_case_and_can_be_invalidated(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=True,
+            value=MagicMock(entries=[{"dn": "uid=test,dc=test,dc=com"}]),
+        )
+        assert client.entry_exists("uid=test,dc=test,dc=com").value is True
+        assert client.entry_exists("UID=Test, DC=test,DC=com").value is True
+        client._api.search.assert_called_once()
+        client.invalidate("uid=test,dc=test,dc=com")
+        assert client.entry_exists("uid=test,dc=test,dc=com").value is True
+        assert client._api.search.call_count == 2
+
+    def test_normalize_dn_is_memoized_and_interned(self) -> None:
+        first = FlextTargetLdapClient._normalize_dn("UID=Test, DC=test,DC=com")
+        second = FlextTargetLdapClient._normalize_dn("uid=test,dc=test,dc=com")
+        assert first == "uid=test,dc=test,dc=com"
+        assert first is second
+
+    def test_to_str_values_decodes_bytes(self) -> None:
+        assert FlextTargetLdapClient.to_str_values(b"caf\xc3\xa9") == ["café"]
+        assert FlextTargetLdapClient.to_str_values(["a", b"b", 3]) == ["a", "b", "3"]
+
+    def test_get_entry_answers_following_entry_exists(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=True,
+            value=MagicMock(entries=[]),
+        )
+        assert client.get_entry("uid=gone,dc=test,dc=com").value is None
+        assert client.entry_exists("uid=gone,dc=test,dc=com").value is False
+        client._api.search.assert_called_once()
+
+    def test_exists_cache_is_thread_safe(self, client: FlextTargetLdapClient) -> None:
+        errors: list[BaseException] = []
+
+        def churn(offset: int) -> None:
+            try:
+                for index in range(200):
+                    dn = f"uid=u{(index + offset) % 50},dc=test,dc=com"
+                    client._remember_exists(dn, exists=index % 2 == 0)
+                    client._cached_exists(dn)
+                    client.invalidate(dn)
+            except (KeyError, RuntimeError) as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=churn, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    def test_entries_exist_maps_every_input_dn_and_chunks_filters(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=True,
+            value=MagicMock(entries=[]),
+        )
+        dns = [
+            f"uid=u{index},ou=people,dc=test,dc=com"
+            for index in range(c.TargetLdap.EXISTS_FILTER_CHUNK + 1)
+        ]
+        result = client.entries_exist([*dns, "UID=U0,ou=people,dc=test,dc=com"])
+        assert result.success
+        assert result.value["UID=U0,ou=people,dc=test,dc=com"] is False
+        assert all(result.value[dn] is False for dn in dns)
+        assert client._api.search.call_count == 2
+
+    def test_failed_search_is_reported_and_not_cached(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        dn = "uid=test,ou=people,dc=test,dc=com"
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.search.return_value = MagicMock(
+            success=False,
+            value=None,
+            error="server busy",
+        )
+        assert client.search_entry("dc=test,dc=com").failure
+        assert client.entries_exist([dn]).failure
+        assert client.entry_exists(dn).value is False
+        assert client._cached_exists(dn) is None
+        assert client._api.search.call_count == 3
+
+    def test_entries_exist_reports_connect_error_as_failure(
+        self, client: FlextTargetLdapClient
+    ) -> None:
+        dn = "uid=test,ou=people,dc=test,dc=com"
+        client._api = MagicMock()
+        client._api.connect.side_effect = RuntimeError("refused")
+        result = client.entries_exist([dn])
+        assert result.failure
+        assert client._cached_exists(dn) is None
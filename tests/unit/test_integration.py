@@ -15,6 +15,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from flext_tests import r
 
 from flext_target_ldap import FlextTargetLdap
 from tests.typings import t
@@ -81,9 +82,9 @@ class TestsFlextTargetLdapIntegration:
         self, mock_ldap_api: MagicMock, config_file: Path, input_file: Path
     ) -> None:
         mock_conn = MagicMock()
-        mock_conn.add_entry.return_value = True
-        mock_conn.delete_entry.return_value = True
-        mock_conn.modify_entry.return_value = True
+        mock_conn.add_entry.return_value = r[bool].ok(True)
+        mock_conn.delete_entry.return_value = r[bool].ok(True)
+        mock_conn.modify_entry.return_value = r[bool].ok(True)
         mock_ldap_api.return_value = mock_conn
 
         _invoke_target_cli(config_file, input_file)
@@ -116,8 +117,8 @@ class TestsFlextTargetLdapIntegration:
         _write_jsonl(input_path, [schema_msg, record1, record2])
 
         mock_conn = MagicMock()
-        mock_conn.add_entry.return_value = True
-        mock_conn.modify_entry.return_value = True
+        mock_conn.add_entry.return_value = r[bool].ok(True)
+        mock_conn.modify_entry.return_value = r[bool].ok(True)
         mock_ldap_api.return_value = mock_conn
 
         _invoke_target_cli(config_file, input_path)
@@ -146,7 +147,7 @@ class TestsFlextTargetLdapIntegration:
         _write_jsonl(input_path, [schema_msg, delete_record])
 
         mock_conn = MagicMock()
-        mock_conn.delete_entry.return_value = True
+        mock_conn.delete_entry.return_value = r[bool].ok(True)
         mock_ldap_api.return_value = mock_conn
 
         _invoke_target_cli(config_file, input_path)
@@ -179,7 +180,7 @@ class TestsFlextTargetLdapIntegration:
         _write_jsonl(input_path, [schema_msg, record])
 
         mock_conn = MagicMock()
-        mock_conn.add_entry.return_value = True
+        mock_conn.add_entry.return_value = r[bool].ok(True)
         mock_ldap_api.return_value = mock_conn
 
         _invoke_target_cli(config_path, input_path)
@@ -239,9 +240,105 @@ class TestsFlextTargetLdapIntegration:
         _write_jsonl(input_path, messages)
 
         mock_conn = MagicMock()
-        mock_conn.add_entry.return_value = True
+        mock_conn.add_entry.return_value = r[bool].ok(True)
         mock_ldap_api.return_value = mock_conn
 
         _invoke_target_cli(config_file, input_path)
 
         assert mock_conn.add_entry.call_count >= 2
+
+    def test_state_message_closes_record_session(
+        self,
+        mock_ldap_api: MagicMock,
+        config_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        input_path = tmp_path / "state_flush.jsonl"
+        _write_jsonl(
+            input_path,
+            [
+                {
+                    "type": "RECORD",
+                    "stream": "users",
+                    "record": {"dn": "uid=user1,dc=test,dc=com"},
+                },
+                {"type": "STATE", "value": {"bookmark": 1}},
+                {
+                    "type": "RECORD",
+                    "stream": "users",
+                    "record": {"dn": "uid=user2,dc=test,dc=com"},
+                },
+            ],
+        )
+
+        mock_conn = MagicMock()
+        mock_conn.add_entry.return_value = r[bool].ok(True)
+        mock_ldap_api.return_value = mock_conn
+
+        _invoke_target_cli(config_file, input_path)
+
+        assert mock_conn.session.call_count == 2
+        assert mock_conn.add_entry.call_count == 2
+
+    def test_existing_entry_falls_back_to_modify(
+        self,
+        mock_ldap_api: MagicMock,
+        config_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        input_path = tmp_path / "existing_input.jsonl"
+        _write_jsonl(
+            input_path,
+            [
+                {
+                    "type": "RECORD",
+                    "stream": "users",
+                    "record": {"dn": "uid=known,dc=test,dc=com", "cn": "Known"},
+                },
+            ],
+        )
+
+        mock_conn = MagicMock()
+        mock_conn.add_entry.return_value = r[bool].fail("Entry already exists")
+        mock_conn.modify_entry.return_value = r[bool].ok(True)
+        mock_ldap_api.return_value = mock_conn
+
+        _invoke_target_cli(config_file, input_path)
+
+        mock_conn.add_entry.assert_called_once()
+        mock_conn.modify_entry.assert_called_once()
+        assert mock_conn.modify_entry.call_args.args[0] == "uid=known,dc=test,dc=com"
+
+    def test_failed_flush_is_not_replayed(
+        self,
+        mock_ldap_api: MagicMock,
+        config_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        input_path = tmp_path / "failed_flush.jsonl"
+        _write_jsonl(
+            input_path,
+            [
+                {
+                    "type": "RECORD",
+                    "stream": "users",
+                    "record": {"dn": "uid=user1,dc=test,dc=com"},
+                },
+                {"type": "STATE", "value": {"bookmark": 1}},
+                {
+                    "type": "RECORD",
+                    "stream": "users",
+                    "record": {"dn": "uid=user2,dc=test,dc=com"},
+                },
+            ],
+        )
+
+        mock_conn = MagicMock()
+        mock_conn.session.side_effect = [RuntimeError("refused"), MagicMock()]
+        mock_conn.add_entry.return_value = r[bool].ok(True)
+        mock_ldap_api.return_value = mock_conn
+
+        _invoke_target_cli(config_file, input_path)
+
+        mock_conn.add_entry.assert_called_once()
+        assert mock_conn.add_entry.call_args.args[0] == "uid=user2,dc=test,dc=com"
@@ -9,6 +9,7 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import pytest
+from flext_tests import r
 
 from flext_target_ldap._models.sinks import (
     FlextTargetLdapBaseSink as LDAPBaseSink,
@@ -348,3 +349,77 @@ class TestsFlextTargetLdapSinks:
         )
         classes = sink.get_object_classes({})
         assert classes == ["customGeneric", "top"]
+
+    def test_connection_settings_built_once_per_sink(
+        self, ldap_base_sink: LDAPBaseSink
+    ) -> None:
+        first = ldap_base_sink.connection_settings()
+        assert ldap_base_sink.connection_settings() is first
+
+    def test_field_plan_resolved_once_per_sink(self, mock_target: MagicMock) -> None:
+        mock_target.settings = {
+            **mock_target.settings,
+            "attribute_mapping": {"nickname": "displayName"},
+        }
+        sink = UsersSink(
+            target=mock_target,
+            stream_name="users",
+            schema={"properties": {"uid": {"type": "string"}}},
+            key_properties=["uid"],
+        )
+        plan = sink.field_plan()
+        assert sink.field_plan() is plan
+        assert plan[-1] == ("nickname", "displayName")
+        attributes = sink.build_user_attributes({"username": "jdoe", "nickname": "J"})
+        assert attributes["uid"] == ["jdoe"]
+        assert attributes["displayName"] == ["J"]
+
+    def test_users_process_record_splits_object_classes(
+        self, users_sink: UsersSink
+    ) -> None:
+        client = MagicMock()
+        client.add_entry.return_value = r[bool].ok(value=True)
+        users_sink.client = client
+        result = users_sink.process_record({"username": "jdoe", "email": "j@x"}, {})
+        assert result.success
+        dn, attributes, object_classes = client.add_entry.call_args.args
+        assert dn == "uid=jdoe,dc=example,dc=com"
+        assert "objectClass" not in attributes
+        assert attributes["mail"] == ["j@x"]
+        assert "inetOrgPerson" in object_classes
+
+    def test_processing_result_counts_without_attribute_dict(
+        self, ldap_base_sink: LDAPBaseSink
+    ) -> None:
+        result = ldap_base_sink._processing_result
+        result.add_success()
+        result.add_error("boom")
+        assert (result.processed_count, result.success_count) == (2, 1)
+        assert result.errors == ["boom"]
+        assert not hasattr(result, "__dict__")
+
+    def test_process_batch_binds_once_per_batch(
+        self,
+        users_sink: UsersSink,
+    ) -> None:
+        client = users_sink.ldap_client()
+        assert users_sink.ldap_client() is client
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].ok(True)
+        client._api.add.return_value = MagicMock(success=True, error=None)
+        users_sink.process_batch({
+            "records": [{"username": "alice"}, {"username": "bob"}],
+        })
+        assert client._api.add.call_count == 2
+        client._api.connect.assert_called_once_with(client.settings)
+        client._api.disconnect.assert_called_once()
+        assert users_sink.client is None
+
+    def test_process_batch_stops_after_failed_bind(self, users_sink: UsersSink) -> None:
+        client = users_sink.ldap_client()
+        client._api = MagicMock()
+        client._api.connect.return_value = r[bool].fail("unreachable")
+        users_sink.process_batch({"records": [{"username": "alice"}]})
+        client._api.connect.assert_called_once_with(client.settings)
+        client._api.add.assert_not_called()
+        assert users_sink.client is None